@@ -1,3 +1,8 @@
+import time
+from collections.abc import Callable
+from enum import Enum
+from itertools import chain
+
 import redis
 import sqlalchemy
 from redis import Redis
@@ -10,6 +15,23 @@ from src.common.common import ENV, console, settings
 HASH_PATTERN = "injection:algorithms"
 STREAM_PATTERN = "trace:*:log"
 TRACE_LOG_KEY = "trace:{}:log"
+# Streams are rebuilt under this suffix and renamed into place once complete,
+# so an interrupted copy never leaves a truncated stream under the real key
+STREAM_TEMP_SUFFIX = ":copying"
+
+SCAN_COUNT = 1000
+STREAM_PAGE_SIZE = 1000
+
+# XRANGE pages of STREAM_PAGE_SIZE entries easily exceed redis-py's default
+# 64 KiB read chunk, so read replies in 1 MiB chunks to cut recv() calls
+SOCKET_READ_SIZE = 1 << 20
+
+# Transient connection errors on a single key are retried instead of
+# being counted as a failure for the whole key, waiting
+# COPY_BACKOFF_SECONDS * 2 ** (attempt - 1) between attempts
+COPY_ATTEMPTS = 3
+COPY_BACKOFF_SECONDS = 1.0
+RETRYABLE_ERRORS = (redis.ConnectionError, redis.TimeoutError)
 
 redis_urls: dict[ENV, str] = {}
 
@@ -24,6 +46,12 @@ def _init_redis_urls():
 _init_redis_urls()
 
 
+class CopyStatus(str, Enum):
+    SUCCESS = "success"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+
+
 class RedisClient:
     def __init__(self, src: ENV, dst: ENV):
         self.src = src
@@ -49,8 +77,18 @@ class RedisClient:
         console.print(f"[cyan]Connecting to target Redis: {target_url}[/cyan]")
 
         try:
-            source_redis: Redis = redis.from_url(source_url, decode_responses=True)
-            target_redis: Redis = redis.from_url(target_url, decode_responses=True)
+            source_redis: Redis = redis.from_url(
+                source_url,
+                decode_responses=True,
+                socket_keepalive=True,
+                socket_read_size=SOCKET_READ_SIZE,
+            )
+            target_redis: Redis = redis.from_url(
+                target_url,
+                decode_responses=True,
+                socket_keepalive=True,
+                socket_read_size=SOCKET_READ_SIZE,
+            )
 
             console.print("[cyan]Testing source Redis connection...[/cyan]")
             source_redis.ping()
@@ -70,6 +108,17 @@ class RedisClient:
             console.print(f"[bold red]Redis connection failed: {e}[/bold red]")
             raise SystemExit(1)
 
+    def scan_keys(self, pattern: str, key_type: str) -> list[str]:
+        """Find source keys of the given type matching the pattern.
+
+        Uses SCAN with a server-side TYPE filter instead of KEYS + one TYPE
+        round trip per key, so large keyspaces are neither blocked nor walked
+        key by key from the client.
+        """
+        return list(
+            self.source_redis.scan_iter(match=pattern, count=SCAN_COUNT, _type=key_type)
+        )
+
     def _read_hashes_fuzzy(self, pattern: str) -> list[str]:
         """
         Find hash tables matching the given pattern using fuzzy matching.
@@ -78,32 +127,24 @@ class RedisClient:
             f"[bold blue]Searching for hash tables matching '{pattern}'...[/bold blue]"
         )
 
-        matching_keys = self.source_redis.keys(pattern)
-        if not matching_keys:
+        hashes = self.scan_keys(pattern, "hash")
+        if not hashes:
             console.print(
                 f"[bold yellow]No hash tables found matching '{pattern}'[/bold yellow]"
             )
             return []
 
-        hashes = []
-        for key in matching_keys:  # type: ignore
-            if self.source_redis.type(key) == "hash":
-                hashes.append(key)
-
-        if not hashes:
-            console.print(
-                "[bold yellow]No hash table data found among matching keys[/bold yellow]"
-            )
-            raise SystemExit(1)
-
         console.print(
             f"[bold green]✅ Found {len(hashes)} matching hash tables[/bold green]"
         )
         return hashes
 
-    def _read_streams_exact(self) -> list[str]:
+    def _read_streams_exact(self) -> list[str] | None:
         """
         Get stream names by querying the database for exact matches.
+
+        Returns:
+            List of stream keys, or None if the database query failed
         """
         console.print("[bold blue]Executing query to get stream names...[/bold blue]")
 
@@ -135,7 +176,7 @@ class RedisClient:
 
         except SQLAlchemyError as e:
             console.print(f"[red]❌ Database query failed: {e}[/red]")
-            raise SystemExit(1)
+            return None
 
     def _read_streams_fuzzy(self, pattern: str) -> list[str]:
         """Find streams matching the given pattern using fuzzy matching.
@@ -144,145 +185,221 @@ class RedisClient:
             pattern: Redis key pattern to match
 
         Returns:
-            List of stream keys that match the pattern
-
-        Raises:
-            typer.Exit: If no matching streams are found
+            List of stream keys that match the pattern, empty if none are found
         """
         console.print(
             f"[bold blue]Searching for streams matching '{pattern}'...[/bold blue]"
         )
 
-        matching_keys = self.source_redis.keys(pattern)
-        if not matching_keys:
-            console.print(f"[bold red]No streams found matching '{pattern}'[/bold red]")
-            raise SystemExit(1)
-
-        # Filter for actual stream type
-        streams = []
-        for key in matching_keys:  # type: ignore
-            if self.source_redis.type(key) == "stream":
-                streams.append(key)
-
+        streams = self.scan_keys(pattern, "stream")
         if not streams:
             console.print(
-                "[bold yellow]No stream type data found among matching keys[/bold yellow]"
+                f"[bold yellow]No streams found matching '{pattern}'[/bold yellow]"
             )
-            raise SystemExit(1)
+            return []
 
         console.print(
             f"[bold green]✅ Found {len(streams)} matching streams[/bold green]"
         )
         return streams
 
-    def copy_hashes(self, force: bool = False, dry_run: bool = False) -> None:
+    def copy_hash(self, key: str, force: bool = False) -> tuple[CopyStatus, str]:
+        """Copy a single hash table from source to target.
+
+        Returns:
+            The copy status and a short description for the progress log
         """
-        Copy hash tables from source to target Redis instance.
+        hash_length = self.source_redis.hlen(key)
+        if hash_length == 0:
+            return CopyStatus.SKIPPED, "empty or non-existent hash table"
+
+        target_exists = self.target_redis.exists(key)
+        if target_exists and not force:
+            target_length = self.target_redis.hlen(key)
+            return CopyStatus.SKIPPED, f"existing ({target_length} fields)"
+
+        all_fields = self.source_redis.hgetall(key)
+        if not all_fields:
+            return CopyStatus.SKIPPED, "empty hash table"
+
+        # Replace and refill the target in a single round trip
+        pipe = self.target_redis.pipeline(transaction=True)
+        if target_exists:
+            pipe.delete(key)
+        pipe.hset(key, mapping=all_fields)  # type: ignore
+        pipe.execute()
+
+        return CopyStatus.SUCCESS, f"{len(all_fields)} fields"  # type: ignore
+
+    def copy_stream(
+        self,
+        key: str,
+        force: bool = False,
+        pipeline_size: int = STREAM_PAGE_SIZE,
+    ) -> tuple[CopyStatus, str]:
+        """Copy a single stream from source to target.
+
+        Messages are read in XRANGE pages of ``pipeline_size`` entries and
+        written back through a non-transactional pipeline, so the number of
+        round trips scales with the page count rather than the message count.
+        The pages go to a temporary key that replaces the target only once
+        every page is written.
+
+        Returns:
+            The copy status and a short description for the progress log
         """
-        hashes = self._read_hashes_fuzzy(HASH_PATTERN)
-        if not hashes:
-            console.print("[bold yellow]No hash tables to copy.[/bold yellow]")
-            return
+        stream_length = self.source_redis.xlen(key)
+        if stream_length == 0:
+            return CopyStatus.SKIPPED, "empty or non-existent stream"
+
+        target_exists = self.target_redis.exists(key)
+        if target_exists and not force:
+            target_length = self.target_redis.xlen(key)
+            return CopyStatus.SKIPPED, f"existing ({target_length} records)"
+
+        # Drop leftovers of an earlier attempt that was interrupted mid-copy
+        temp_key = f"{key}{STREAM_TEMP_SUFFIX}"
+        self.target_redis.delete(temp_key)
+
+        copied_count = 0
+        message_failed_count = 0
+        min_id = "-"
+
+        while True:
+            messages = self.source_redis.xrange(key, min=min_id, count=pipeline_size)
+            if not messages:
+                break
+
+            # Hand XADD a pre-flattened argument list instead of letting
+            # xadd() rebuild it from the field mapping for every message
+            pipe = self.target_redis.pipeline(transaction=False)
+            for _, fields in messages:  # type: ignore
+                pipe.execute_command(
+                    "XADD", temp_key, "*", *chain.from_iterable(fields.items())
+                )
 
-        if dry_run:
-            console.print(
-                "[bold yellow]Dry run mode, no data will be actually copied[/bold yellow]"
-            )
-            return
+            for result in pipe.execute(raise_on_error=False):
+                if isinstance(result, Exception):
+                    message_failed_count += 1
+                else:
+                    copied_count += 1
+
+            if len(messages) < pipeline_size:  # type: ignore
+                break
+            min_id = f"({messages[-1][0]}"  # type: ignore
+
+        if copied_count == 0:
+            self.target_redis.delete(temp_key)
+            return CopyStatus.FAILED, "no records copied"
 
+        # RENAME replaces an existing target atomically
+        self.target_redis.rename(temp_key, key)
+
+        description = f"{copied_count} records"
+        if message_failed_count > 0:
+            description += f" ({message_failed_count} failed)"
+        return CopyStatus.SUCCESS, description
+
+    def _copy_keys(
+        self,
+        keys: list[str],
+        kind: str,
+        copy_func: Callable[[str], tuple[CopyStatus, str]],
+    ) -> bool:
+        """Run a per-key copy function over all keys and report the totals.
+
+        Returns:
+            True if no key failed to copy
+        """
         console.print("[bold blue]Starting batch copy...[/bold blue]")
 
-        success_count = 0
-        failed_count = 0
-        skipped_count = 0
+        counts = dict.fromkeys(CopyStatus, 0)
+        total = len(keys)
 
-        for i, source_key in enumerate(hashes, 1):
-            try:
-                target_key = source_key
-
-                # Check source hash table
-                if not self.source_redis.exists(source_key):
-                    console.print(
-                        f"[bold yellow][{i}/{len(hashes)}] Skipping non-existent: {source_key}[/bold yellow]"
-                    )
-                    skipped_count += 1
-                    continue
-
-                hash_length = self.source_redis.hlen(source_key)
-                if hash_length == 0:
-                    console.print(
-                        f"[bold yellow][{i}/{len(hashes)}] Skipping empty hash table: {source_key}[/bold yellow]"
-                    )
-                    skipped_count += 1
-                    continue
-
-                # Check target hash table
-                target_exists = self.target_redis.exists(target_key)
-                if target_exists and not force:
-                    target_length = self.target_redis.hlen(target_key)
-                    console.print(
-                        f"[bold yellow][{i}/{len(hashes)}] Skipping existing: {source_key} ({target_length} fields)[/bold yellow]"
-                    )
-                    skipped_count += 1
-                    continue
-
-                # Display current hash table being processed
+        for i, key in enumerate(keys, 1):
+            status, description = self._copy_with_retry(key, copy_func)
+
+            counts[status] += 1
+            if status == CopyStatus.SUCCESS:
                 console.print(
-                    f"[bold blue][{i}/{len(hashes)}] Copying: {source_key} ({hash_length} fields)[/bold blue]"
+                    f"[dim]  [bold green]✓[/bold green] [{i}/{total}] {key}: {description}[/dim]"
+                )
+            elif status == CopyStatus.SKIPPED:
+                console.print(
+                    f"[bold yellow][{i}/{total}] Skipping {key}: {description}[/bold yellow]"
+                )
+            else:
+                console.print(
+                    f"[bold red][{i}/{total}] Copy failed: {key} - {description}[/bold red]"
                 )
 
-                # Delete target hash table if force is needed
-                if target_exists and force:
-                    self.target_redis.delete(target_key)
-
-                # Get and copy hash data
-                all_fields = self.source_redis.hgetall(source_key)
-                if not all_fields:
-                    skipped_count += 1
-                    continue
-
-                try:
-                    # Batch set hash fields
-                    self.target_redis.hset(target_key, mapping=all_fields)  # type: ignore
-                    success_count += 1
-                    console.print(
-                        f"[dim]  [bold green]✓[/bold green] {len(all_fields)} fields[dim]"  # type: ignore
-                    )
-                except Exception as e:
-                    failed_count += 1
-                    console.print(
-                        f"[dim] [bold red]  ✗ Copy failed: {e}[/bold red][dim]"
-                    )
-
-                # Show progress every 10 hash tables
-                if i % 10 == 0:
-                    console.print(
-                        f"[dim]Progress: {i}/{len(hashes)} ({success_count} success, {failed_count} failed, {skipped_count} skipped)[/dim]"  # noqa: E501
-                    )
-
-            except Exception as e:
-                failed_count += 1
+            # Show progress every 10 keys
+            if i % 10 == 0:
                 console.print(
-                    f"[bold red][{i}/{len(hashes)}] Processing failed: {source_key} - {e}[/bold red]"
+                    f"[dim]Progress: {i}/{total} ({counts[CopyStatus.SUCCESS]} success, {counts[CopyStatus.FAILED]} failed, {counts[CopyStatus.SKIPPED]} skipped)[/dim]"  # noqa: E501
                 )
 
         # Display final results
         console.print()
         console.print("[bold green]Batch copy completed[/bold green]")
         console.print(
-            f"[bold green]✅ Success: {success_count} hash tables[/bold green]"
+            f"[bold green]✅ Success: {counts[CopyStatus.SUCCESS]} {kind}[/bold green]"
         )
 
-        if failed_count > 0:
-            console.print(f"[bold red]❌ Failed: {failed_count} hash tables[/bold red]")
+        if counts[CopyStatus.FAILED] > 0:
+            console.print(
+                f"[bold red]❌ Failed: {counts[CopyStatus.FAILED]} {kind}[/bold red]"
+            )
 
-        if skipped_count > 0:
+        if counts[CopyStatus.SKIPPED] > 0:
             console.print(
-                f"[bold yellow]🚫 Skipped: {skipped_count} hash tables[/bold yellow]"
+                f"[bold yellow]🚫 Skipped: {counts[CopyStatus.SKIPPED]} {kind}[/bold yellow]"
             )
 
-        console.print(
-            f"[bold green]Total processed: {len(hashes)} hash tables[/bold green]"
+        console.print(f"[bold green]Total processed: {total} {kind}[/bold green]")
+        return counts[CopyStatus.FAILED] == 0
+
+    @staticmethod
+    def _copy_with_retry(
+        key: str, copy_func: Callable[[str], tuple[CopyStatus, str]]
+    ) -> tuple[CopyStatus, str]:
+        """Copy one key, retrying transient connection errors."""
+        for attempt in range(1, COPY_ATTEMPTS + 1):
+            try:
+                return copy_func(key)
+            except RETRYABLE_ERRORS as e:
+                if attempt == COPY_ATTEMPTS:
+                    return CopyStatus.FAILED, f"{e} (after {attempt} attempts)"
+                delay = COPY_BACKOFF_SECONDS * 2 ** (attempt - 1)
+                console.print(
+                    f"[dim]  Retrying {key} in {delay:.0f}s ({attempt}/{COPY_ATTEMPTS}): {e}[/dim]"  # noqa: E501
+                )
+                time.sleep(delay)
+            except Exception as e:
+                return CopyStatus.FAILED, str(e)
+
+        return CopyStatus.FAILED, "no copy attempt made"
+
+    def copy_hashes(self, force: bool = False, dry_run: bool = False) -> bool:
+        """
+        Copy hash tables from source to target Redis instance.
+
+        Returns:
+            True if no hash table failed to copy
+        """
+        hashes = self._read_hashes_fuzzy(HASH_PATTERN)
+        if not hashes:
+            console.print("[bold yellow]No hash tables to copy.[/bold yellow]")
+            return True
+
+        if dry_run:
+            console.print(
+                "[bold yellow]Dry run mode, no data will be actually copied[/bold yellow]"
+            )
+            return True
+
+        return self._copy_keys(
+            hashes, "hash tables", lambda key: self.copy_hash(key, force=force)
         )
 
     def copy_streams(
@@ -290,118 +407,30 @@ class RedisClient:
         exact_match: bool = False,
         force: bool = False,
         dry_run: bool = False,
-    ) -> None:
+    ) -> bool:
         """
         Copy Redis streams from source to target instance.
+
+        Returns:
+            True if the stream names could be read and no stream failed to copy
         """
         if exact_match:
             streams = self._read_streams_exact()
+            if streams is None:
+                return False
         else:
             streams = self._read_streams_fuzzy(STREAM_PATTERN)
 
+        if not streams:
+            console.print("[bold yellow]No streams to copy.[/bold yellow]")
+            return True
+
         if dry_run:
             console.print(
                 "[bold yellow]Dry run mode, no data will be actually copied[/bold yellow]"
             )
-            return
-
-        console.print("[bold blue]Starting batch copy...[/bold blue]")
-
-        success_count = 0
-        failed_count = 0
-        skipped_count = 0
-
-        for i, source_key in enumerate(streams, 1):
-            try:
-                target_key = source_key
-
-                # Check source stream
-                if not self.source_redis.exists(source_key):
-                    console.print(
-                        f"[bold yellow][{i}/{len(streams)}] Skipping non-existent: {source_key}[/bold yellow]"
-                    )
-                    skipped_count += 1
-                    continue
-
-                stream_length = self.source_redis.xlen(source_key)
-                if stream_length == 0:
-                    console.print(
-                        f"[bold yellow][{i}/{len(streams)}] Skipping empty stream: {source_key}[/bold yellow]"
-                    )
-                    skipped_count += 1
-                    continue
-
-                # Check target stream
-                target_exists = self.target_redis.exists(target_key)
-                if target_exists and not force:
-                    target_length = self.target_redis.xlen(target_key)
-                    console.print(
-                        f"[bold yellow][{i}/{len(streams)}] Skipping existing: {source_key} ({target_length} records)[/bold yellow]"  # noqa: E501
-                    )
-                    skipped_count += 1
-                    continue
-
-                # Display current stream being processed
-                console.print(
-                    f"[bold blue][{i}/{len(streams)}] Copying: {source_key} ({stream_length} records)[/bold blue]"
-                )
-
-                # Delete target stream if force is needed
-                if target_exists and force:
-                    self.target_redis.delete(target_key)
-
-                # Get and copy messages
-                messages = self.source_redis.xrange(source_key)
-                if not messages:
-                    skipped_count += 1
-                    continue
-
-                copied_count = 0
-                message_failed_count = 0
-
-                for _, fields in messages:  # type: ignore
-                    try:
-                        self.target_redis.xadd(target_key, fields)
-                        copied_count += 1
-                    except Exception:
-                        message_failed_count += 1
-
-                if copied_count > 0:
-                    success_count += 1
-                    status_msg = "[bold green]✅[/bold green]"
-                    if message_failed_count > 0:
-                        status_msg += f" [bold yellow]({message_failed_count} failed)[/bold yellow]"
-
-                    console.print(f"[dim]  {status_msg} {copied_count} records[/dim]")
-                else:
-                    failed_count += 1
-                    console.print("[bold red]❌ Copy failed[/bold red]")
+            return True
 
-                # Show progress every 10 streams
-                if i % 10 == 0:
-                    console.print(
-                        f"[dim]Progress: {i}/{len(streams)} ({success_count} success, {failed_count} failed, {skipped_count} skipped)[/dim]"  # noqa: E501
-                    )
-
-            except Exception as e:
-                failed_count += 1
-                console.print(
-                    f"[bold red][{i}/{len(streams)}] Processing failed: {source_key} - {e}[/bold red]"
-                )
-
-        # Display final results
-        console.print()
-        console.print("[bold green]Batch copy completed[/bold green]")
-        console.print(f"[bold green]✅ Success: {success_count} streams[/bold green]")
-
-        if failed_count > 0:
-            console.print(f"[bold red]❌ Failed: {failed_count} streams[/bold red]")
-
-        if skipped_count > 0:
-            console.print(
-                f"[bold yellow]🚫 Skipped: {skipped_count} streams[/bold yellow]"
-            )
-
-        console.print(
-            f"[bold green]Total processed: {len(streams)} streams[/bold green]"
+        return self._copy_keys(
+            streams, "streams", lambda key: self.copy_stream(key, force=force)
         )
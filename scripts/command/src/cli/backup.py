@@ -134,17 +134,21 @@ def redis_migrate(
     console.print(
         f"[bold blue]Step 1: Restoring hash data from {src.value} server...[/bold blue]"
     )
-    client.copy_hashes(force, dry_run=dry_run)
+    hashes_ok = client.copy_hashes(force, dry_run=dry_run)
     console.print()
 
     console.print(
         f"[bold blue]Step 2: Restoring stream data to {dst.value} server...[/bold blue]"
     )
-    client.copy_streams(
+    streams_ok = client.copy_streams(
         exact_match,
         force=force,
         dry_run=dry_run,
     )
     console.print()
 
+    if not (hashes_ok and streams_ok):
+        console.print("[bold red]❌ Redis migration finished with errors[/bold red]")
+        raise typer.Exit(code=1)
+
     console.print("[bold green]✅ Redis migration completed successfully![/bold green]")
@@ -94,6 +94,8 @@ class PortForwardManager:
         """Cleanup existing port forward processes"""
         console.print("[bold blue]🧹 Cleaning up old port forwards...[/bold blue]")
 
+        killed_procs: list[psutil.Process] = []
+
         # Kill kubectl port-forward processes
         killed_count = 0
         for proc in psutil.process_iter(["pid", "name", "cmdline"]):
@@ -102,6 +104,7 @@ class PortForwardManager:
                 cmdline_str = " ".join(str(c) for c in cmdline)
                 if "kubectl" in cmdline_str and "port-forward" in cmdline_str:
                     proc.kill()
+                    killed_procs.append(proc)
                     killed_count += 1
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 continue
@@ -121,6 +124,7 @@ class PortForwardManager:
                     if port in local_ports:
                         proc = psutil.Process(conn.pid)
                         proc.kill()
+                        killed_procs.append(proc)
                         port_killed_count += 1
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 continue
@@ -130,7 +134,9 @@ class PortForwardManager:
                 f"   Killed {port_killed_count} process(es) on specific ports"
             )
 
-        time.sleep(2)
+        # Wait for the killed processes to exit so their ports are released,
+        # instead of sleeping a fixed amount even when nothing was killed
+        psutil.wait_procs(killed_procs, timeout=2)
         console.print("[bold green]✅ Old forwards cleaned[/bold green]\n")
 
     def _calculate_local_port(self, remote_port: int) -> int:
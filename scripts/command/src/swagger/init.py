@@ -2,6 +2,7 @@ import copy
 import json
 import shutil
 import sys
+from collections import deque
 from pathlib import Path
 from typing import Any
 
@@ -359,6 +360,9 @@ class SDKPostProcesser:
         "*|status": "StatusType",
     }
 
+    # Path prefixes stripped to get the resource part of a mapping key
+    API_PATH_PREFIXES = ("/api/v2/", "/system/")
+
     # Models that should always be kept in SDK even if not directly referenced
     # These are typically used in SSE events or other indirect references
     ALWAYS_KEEP_MODELS = {
@@ -454,24 +458,32 @@ class SDKPostProcesser:
 
         name_mapping = {}
 
-        for old_name in list(schemas.keys()):
+        for old_name in schemas:
+            # Most schemas need no renaming at all
+            if not (
+                old_name.startswith(
+                    ("consts.", "dto.", "handler.", "ChaosChaos", "ListResp-")
+                )
+                or "dto_" in old_name
+                or "GenericResponse-ListResp-" in old_name
+            ):
+                continue
+
             new_name = old_name
 
             # Remove 'consts.' prefix
-            if new_name.startswith("consts."):
-                new_name = new_name.replace("consts.", "", 1)
+            new_name = new_name.removeprefix("consts.")
 
             # Remove 'dto.' prefix
-            if new_name.startswith("dto."):
-                new_name = new_name.replace("dto.", "", 1)
+            new_name = new_name.removeprefix("dto.")
 
             # Replace 'handler.' prefix with 'Chaos'
             if new_name.startswith("handler."):
-                new_name = new_name.replace("handler.", "Chaos", 1)
+                new_name = "Chaos" + new_name.removeprefix("handler.")
 
             # Fix duplicate 'Chaos' prefix (e.g., ChaosChaosType -> ChaosType)
             if new_name.startswith("ChaosChaos"):
-                new_name = new_name.replace("ChaosChaos", "Chaos", 1)
+                new_name = new_name.removeprefix("Chaos")
 
             # Also handle nested patterns like 'dto.GenericResponse-dto_XXX'
             # Convert to 'GenericResponse-XXX'
@@ -495,11 +507,14 @@ class SDKPostProcesser:
                 name_mapping[old_name] = new_name
                 console.print(f"[gray]   {old_name} -> {new_name}[/gray]")
 
-        # Step 1: Rename keys in schemas
-        new_schemas = {}
-        for old_name, schema_def in schemas.items():
-            new_name = name_mapping.get(old_name, old_name)
-            new_schemas[new_name] = schema_def
+        # Step 1: Rename keys in schemas. The dict is rebuilt rather than
+        # renamed in place so the emitted spec keeps the original model order.
+        new_schemas = schemas
+        if name_mapping:
+            new_schemas = {
+                name_mapping.get(old_name, old_name): schema_def
+                for old_name, schema_def in schemas.items()
+            }
 
         for key, value in new_schemas.items():
             if "enum" not in value:
@@ -530,23 +545,29 @@ class SDKPostProcesser:
         self.data["components"]["schemas"] = new_schemas
 
         # Step 2: Update all $ref references throughout the entire JSON
+        if not name_mapping:
+            return
+
+        ref_mapping = {
+            f"{schema_path}{old_name}": f"{schema_path}{new_name}"
+            for old_name, new_name in name_mapping.items()
+        }
+
         def update_refs(obj: dict[str, Any] | list[dict[str, Any]]) -> None:
-            """Recursively update all $ref values in the JSON object"""
-            if isinstance(obj, dict):
-                for key, value in list(obj.items()):
-                    if key == "$ref" and isinstance(value, str):
-                        # Extract the schema name from the reference
-                        if value.startswith(schema_path):
-                            old_schema_name = value.replace(schema_path, "")
-                            new_schema_name = name_mapping.get(
-                                old_schema_name, old_schema_name
-                            )
-                            obj[key] = f"{schema_path}{new_schema_name}"
-                    else:
-                        update_refs(value)
-            elif isinstance(obj, list):
-                for item in obj:
-                    update_refs(item)
+            """Update all $ref values in the JSON object"""
+            stack: list[Any] = [obj]
+            while stack:
+                node = stack.pop()
+                if isinstance(node, dict):
+                    for key, value in node.items():
+                        if key == "$ref":
+                            # Only renamed schemas need their reference rewritten
+                            if isinstance(value, str) and value in ref_mapping:
+                                node[key] = ref_mapping[value]
+                        elif isinstance(value, (dict, list)):
+                            stack.append(value)
+                elif isinstance(node, list):
+                    stack.extend(node)
 
         # Update refs in paths
         update_refs(self.data.get("paths", {}))
@@ -643,6 +664,12 @@ class SDKPostProcesser:
         converted_count = 0
         skipped_count = 0
 
+        # Index the "resource|parameter" mapping by parameter name
+        schemas_by_param: dict[str, dict[str, str]] = {}
+        for mapping_key, target_schema in self.PARAMETER_SCHEMA_MAPPING.items():
+            resource, param_name = mapping_key.split("|", 1)
+            schemas_by_param.setdefault(param_name, {})[resource] = target_schema
+
         def process_parameters(
             params: list[dict[str, Any]], path: str, method: str
         ) -> None:
@@ -661,27 +688,26 @@ class SDKPostProcesser:
                     continue
 
                 # Check if it's an inline enum definition
-                if "enum" not in schema or schema.get("type") not in [
+                if "enum" not in schema or schema.get("type") not in (
                     "integer",
                     "string",
-                ]:
+                ):
+                    continue
+
+                schemas_by_resource = schemas_by_param.get(param_name)
+                if not schemas_by_resource:
                     continue
 
                 # Try path-specific mapping first
                 resource = "*"
-                for prefix in ["/api/v2/", "/system/"]:
+                for prefix in self.API_PATH_PREFIXES:
                     if path.startswith(prefix):
                         resource = path.removeprefix(prefix)
-                        console.print(
-                            f"[gray]Match Found: Removed prefix '{prefix}'[/gray]"
-                        )
-
-                mapping_key = f"{resource}|{param_name}"
-                target_schema = self.PARAMETER_SCHEMA_MAPPING.get(mapping_key)
+                        break
 
+                target_schema = schemas_by_resource.get(resource)
                 if not target_schema:
-                    wildcard_key = f"*|{param_name}"
-                    target_schema = self.PARAMETER_SCHEMA_MAPPING.get(wildcard_key)
+                    target_schema = schemas_by_resource.get("*")
 
                 if target_schema and target_schema in available_schemas:
                     # Replace inline enum with $ref
@@ -706,8 +732,9 @@ class SDKPostProcesser:
                     continue
 
                 # Process parameters at operation level
-                if "parameters" in spec and isinstance(spec["parameters"], list):
-                    process_parameters(spec["parameters"], path, method)
+                params = spec.get("parameters")
+                if params and isinstance(params, list):
+                    process_parameters(params, path, method)
 
         if converted_count > 0:
             console.print(
@@ -739,9 +766,11 @@ class SDKPostProcesser:
         }
         audience_keys = audience_keys_by_mode.get(category)
         if not audience_keys:
-            return copy.deepcopy(self.data)
+            return self.data
 
-        new_data = copy.deepcopy(self.data)
+        # The result is only serialized, so nested specs and schemas can be
+        # shared with self.data; copy just the containers replaced below.
+        new_data = {**self.data, "components": {**self.data["components"]}}
 
         # Step 1: Filter paths - keep only operations tagged for the target audience.
         original_paths = new_data["paths"]
@@ -768,27 +797,30 @@ class SDKPostProcesser:
         new_data["paths"] = filtered_paths
 
         # Step 2: Determine schema location and collect model references
-        used_models = set()
+        used_models: set[str] = set()
 
         schemas = new_data["components"]["schemas"]
         schema_path = "#/components/schemas/"
 
-        def collect_refs(obj: dict[str, Any] | list[dict[str, Any]]) -> None:
-            """Recursively collect all $ref model names"""
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    if key == "$ref" and isinstance(value, str):
-                        if value.startswith(schema_path):
-                            model_name = value.replace(schema_path, "")
-                            used_models.add(model_name)
-                    else:
-                        collect_refs(value)
-            elif isinstance(obj, list):
-                for item in obj:
-                    collect_refs(item)
+        def collect_refs(
+            obj: dict[str, Any] | list[dict[str, Any]], into: set[str]
+        ) -> None:
+            """Collect all $ref model names in the JSON object"""
+            stack: list[Any] = [obj]
+            while stack:
+                node = stack.pop()
+                if isinstance(node, dict):
+                    for key, value in node.items():
+                        if key == "$ref" and isinstance(value, str):
+                            if value.startswith(schema_path):
+                                into.add(value.removeprefix(schema_path))
+                        elif isinstance(value, (dict, list)):
+                            stack.append(value)
+                elif isinstance(node, list):
+                    stack.extend(node)
 
         # Collect refs from filtered paths
-        collect_refs(filtered_paths)
+        collect_refs(filtered_paths, used_models)
 
         # Add models that should always be kept
         used_models.update(self.ALWAYS_KEEP_MODELS)
@@ -796,15 +828,20 @@ class SDKPostProcesser:
             f"[gray]   → Force-keeping {len(self.ALWAYS_KEEP_MODELS)} models: {', '.join(sorted(self.ALWAYS_KEEP_MODELS))}[/gray]"
         )
 
-        # Step 3: Recursively collect nested model dependencies
+        # Step 3: Collect nested model dependencies breadth-first, walking each
+        # newly discovered schema exactly once
         if schemas is not None:
-            # Keep adding models until no new models are found
-            prev_size = 0
-            while len(used_models) != prev_size:
-                prev_size = len(used_models)
-                for model_name in list(used_models):
-                    if model_name in schemas:
-                        collect_refs(schemas[model_name])
+            worklist = deque(used_models)
+            while worklist:
+                model_name = worklist.popleft()
+                if model_name not in schemas:
+                    continue
+
+                nested_models: set[str] = set()
+                collect_refs(schemas[model_name], nested_models)
+                for nested_model in nested_models - used_models:
+                    used_models.add(nested_model)
+                    worklist.append(nested_model)
 
         # Step 4: Filter schemas - keep only used models
         if schemas is not None:
@@ -881,11 +918,9 @@ def init(
         "[bold blue]📦 Post-processing generated OpenAPI artifacts...[/bold blue]"
     )
 
-    if not CONVERTED_DIR.exists():
-        CONVERTED_DIR.mkdir(parents=True)
-    else:
-        stale_typescript_file = CONVERTED_DIR / "typescript.json"
-        stale_typescript_file.unlink(missing_ok=True)
+    CONVERTED_DIR.mkdir(parents=True, exist_ok=True)
+    stale_typescript_file = CONVERTED_DIR / "typescript.json"
+    stale_typescript_file.unlink(missing_ok=True)
 
     post_input_file = OPENAPI3_DIR / "openapi.json"
     sdk_file = CONVERTED_DIR / "sdk.json"
@@ -893,11 +928,6 @@ def init(
     portal_file = CONVERTED_DIR / "portal.json"
     admin_file = CONVERTED_DIR / "admin.json"
 
-    shutil.copyfile(post_input_file, dst=sdk_file)
-    shutil.copyfile(post_input_file, dst=runtime_file)
-    shutil.copyfile(post_input_file, dst=portal_file)
-    shutil.copyfile(post_input_file, dst=admin_file)
-
     processor = SDKPostProcesser(post_input_file)
     processor.update_version(version)
     processor.add_sse_extensions()
@@ -1,6 +1,3 @@
-import copy
-
-
 def extract_docker_tag(image_ref: str) -> str:
     """Extract the Docker tag from an image reference."""
     last_colon_index = image_ref.rfind(":")
@@ -16,19 +13,31 @@ def get_longest_common_substring(key: str, strs: list[str]) -> str:
     if not strs:
         return ""
 
-    newStrs = copy.deepcopy(strs)
-    newStrs.insert(0, key)
-
-    shortest_str = min(newStrs, key=len)
+    all_strs = [key, *strs]
+    shortest_str = min(all_strs, key=len)
     n = len(shortest_str)
 
-    for length in range(n, 0, -1):
-        for i in range(n - length + 1):
-            substring = shortest_str[i : i + length]
-            if all(substring in s for s in newStrs):
-                return substring
+    def is_common(substring: str) -> bool:
+        return all(substring in s for s in all_strs)
+
+    # Every prefix of a common substring is common as well, so for each start
+    # position the longest common extension can be found by binary search.
+    best_start, best_len = 0, 0
+    for i in range(n - best_len):
+        lo, hi = best_len + 1, n - i
+        if lo > hi or not is_common(shortest_str[i : i + lo]):
+            continue
+
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if is_common(shortest_str[i : i + mid]):
+                lo = mid
+            else:
+                hi = mid - 1
+
+        best_start, best_len = i, lo
 
-    return ""
+    return shortest_str[best_start : best_start + best_len]
 
 
 def parse_image_address(image_address) -> dict[str, str | None]:
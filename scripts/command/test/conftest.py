@@ -17,14 +17,14 @@ def setup_environment() -> Generator[ApiClient, None, None]:
     manager = PortForwardManager(env=ENV.TEST)
     manager.start_forwarding()
 
-    with RCABenchClient(
-        base_url=manager.get_service_url("rcabench-exp"),
-        username="admin",
-        password="admin123",
-    ).get_client() as client:
-        yield client
-
-    manager.stop_all_forwards()
+    try:
+        # One pooled ApiClient serves every test module for the whole session;
+        # credentials come from RCABENCH_KEY_ID / RCABENCH_KEY_SECRET
+        yield RCABenchClient(
+            base_url=manager.get_service_url("rcabench-exp")
+        ).get_client()
+    finally:
+        manager.stop_all_forwards()
 
 
 def pytest_generate_tests(metafunc):
@@ -10,16 +10,79 @@ from rcabench.openapi import (
     DtoSubmitDatasetBuildingReq,
     DtoSubmitExecutionReq,
 )
+from rcabench.openapi.exceptions import ApiException
 from rcabench.openapi.models.dto_dataset_build_payload import DtoDatasetBuildPayload
-import time
+import asyncio
 import typer
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Optional
+from enum import Enum
+from itertools import islice
+from typing import Callable, Dict, Any, Iterable, List, Optional, Tuple
 
 app = typer.Typer()
 
+# Upper bound for the submission interval after repeated server failures (seconds)
+MAX_SUBMIT_INTERVAL = 300
+
+
+class SubmitOutcome(str, Enum):
+    ACCEPTED = "accepted"
+    # The server answered but refused some payloads (4xx other than 429)
+    REJECTED = "rejected"
+    # 5xx, 429, timeouts and connection errors: the server needs room to recover
+    SERVER_ERROR = "server_error"
+
+
+# Dependent rows of stale fault_injections, in foreign key dependency order.
+# `{ids}` is replaced by one placeholder per injection id in the chunk.
+DELETE_STALE_INJECTION_QUERIES = [
+    # 1. Delete detector_results table
+    """DELETE dr FROM detector_results dr
+JOIN executions e ON dr.execution_id = e.id
+WHERE e.datapack_id IN ({ids})""",
+    # 2. Delete granularity_results table
+    """DELETE gr FROM granularity_results gr
+JOIN executions e ON gr.execution_id = e.id
+WHERE e.datapack_id IN ({ids})""",
+    # 3. Delete executions table
+    "DELETE FROM executions WHERE datapack_id IN ({ids})",
+    # 4. Delete dataset_version_injections table
+    "DELETE FROM dataset_version_injections WHERE injection_id IN ({ids})",
+    # 5. Finally delete main table fault_injections
+    "DELETE FROM fault_injections WHERE id IN ({ids})",
+]
+
+# Keeps each IN (...) list well under max_allowed_packet
+IN_CLAUSE_CHUNK_SIZE = 1000
+
+# New fault_injections rows committed per transaction in align_db; a failing
+# group is split in half and retried until the offending record is isolated
+INSERT_GROUP_SIZE = 1000
+
+# Each open on the JuiceFS dataset mount is a network round trip, so
+# injection.json files are read concurrently
+INJECTION_LOAD_WORKERS = 32
+
+# Placeholder tasks for local datasets whose task no longer exists; tasks that
+# are still present are left untouched
+INSERT_TASK_QUERY = """
+INSERT INTO tasks (id, type, immediate, execute_time, state, status, created_at, updated_at)
+VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+ON DUPLICATE KEY UPDATE id = id
+"""
+
+INSERT_INJECTION_QUERY = """
+INSERT INTO fault_injections (
+    name, fault_type, display_config, engine_config,
+    pre_duration, start_time, end_time, state, status,
+    description, benchmark_id, pedestal_id, task_id,
+    created_at, updated_at
+) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
 
 def connect_mysql(host: str, user: str, password: str, dbname: str, port: int):
     return mysql.connector.connect(
@@ -31,6 +94,150 @@ def connect_mysql(host: str, user: str, password: str, dbname: str, port: int):
     )
 
 
+def get_api_client(base_url: str, pool_maxsize: Optional[int] = None) -> ApiClient:
+    """Build an RCABench API client for base_url.
+
+    When `pool_maxsize` is given, the client's urllib3 pool keeps at least
+    that many connections so that concurrent submission threads reuse them
+    instead of reconnecting.
+    """
+    configuration = Configuration(host=base_url)
+    if pool_maxsize is not None:
+        configuration.connection_pool_maxsize = max(
+            configuration.connection_pool_maxsize or 0, pool_maxsize
+        )
+    return ApiClient(configuration=configuration)
+
+
+def print_mysql_version(connection) -> None:
+    """Print the server version reported in the connection handshake.
+
+    This replaces a `SELECT VERSION()` round trip per command.
+    """
+    print(f"📋 MySQL version: {connection.get_server_info()}")
+
+
+def load_injection_json(injection_json_path: str) -> Optional[Dict[str, Any]]:
+    """Parse an injection.json file, returning None if it does not exist."""
+    try:
+        with open(injection_json_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def submit_payloads(
+    post: Callable[[List[Any]], Any], payloads: List[Any], kind: str
+) -> SubmitOutcome:
+    """Submit payloads in one request, falling back to one request per payload.
+
+    A 4xx response other than 429 means the server rejected the whole
+    request, so the payloads are retried individually and one bad record no
+    longer sinks the rest of its batch. Other failures are not retried, since
+    the server may already have accepted the batch. A batch is reported as a
+    server error if any of its requests hit one, and as rejected if the
+    server only refused some payloads.
+    """
+    try:
+        resp = post(payloads)
+        print(f"  🔄 {kind} submission successful: {resp}")
+        return SubmitOutcome.ACCEPTED
+    except ApiException as e:
+        status = e.status or 0
+        if not 400 <= status < 500 or status == 429:
+            print(f"  ❌ {kind} submission failed: {e}")
+            return SubmitOutcome.SERVER_ERROR
+        if len(payloads) == 1:
+            print(f"  ❌ {kind} submission rejected: {e}")
+            return SubmitOutcome.REJECTED
+        print(
+            f"  ⚠️ {kind} batch rejected ({e.status}), retrying {len(payloads)} payloads individually"
+        )
+    except Exception as e:
+        print(f"  ❌ {kind} submission failed: {e}")
+        return SubmitOutcome.SERVER_ERROR
+
+    outcomes = {submit_payloads(post, [payload], kind) for payload in payloads}
+    for outcome in (SubmitOutcome.SERVER_ERROR, SubmitOutcome.REJECTED):
+        if outcome in outcomes:
+            return outcome
+    return SubmitOutcome.ACCEPTED
+
+
+def submit_batches(
+    rows: Iterable[Dict[str, Any]],
+    submit_batch: Callable[[int, List[Dict[str, Any]]], SubmitOutcome],
+    batch_size: int,
+    concurrency: int,
+    sleep_time: int,
+) -> int:
+    """Group rows into batches and submit them concurrently, at most `concurrency` at a time.
+
+    `rows` is consumed lazily, and reading pauses whenever `concurrency`
+    submissions are pending. Pass a buffered cursor rather than an
+    unbuffered one: submissions can be paced minutes apart, and MySQL drops a
+    connection whose pending result set goes unread for longer than
+    net_write_timeout. `submit_batch(index, batch)` sends
+    one request carrying every row of the batch and returns its
+    SubmitOutcome. Submissions start at least `sleep_time` seconds apart, so
+    the server sees the same pace as before without workers idling after each
+    request has already completed. Each server error doubles that interval
+    (up to MAX_SUBMIT_INTERVAL) and every other outcome halves it back towards
+    `sleep_time`, so a struggling server gets room to recover while rejected
+    input rows do not slow down a healthy one.
+    Returns the number of rows read.
+    """
+    rows = iter(rows)
+
+    def next_batch() -> List[Dict[str, Any]]:
+        return list(islice(rows, batch_size))
+
+    async def run() -> int:
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(concurrency)
+        pacing = asyncio.Lock()
+        next_start = loop.time()
+        interval = float(sleep_time)
+
+        async def wait_turn() -> None:
+            nonlocal next_start
+            async with pacing:
+                delay = next_start - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                next_start = loop.time() + interval
+
+        async def bounded(index: int, batch: List[Dict[str, Any]]) -> None:
+            nonlocal interval
+            try:
+                await wait_turn()
+                outcome = await asyncio.to_thread(submit_batch, index, batch)
+                if outcome == SubmitOutcome.SERVER_ERROR:
+                    interval = min(max(interval * 2, 1.0), MAX_SUBMIT_INTERVAL)
+                    print(f"  ⏳ Backing off: next submission in {interval:.0f}s")
+                else:
+                    interval = max(float(sleep_time), interval / 2)
+            finally:
+                semaphore.release()
+
+        tasks = []
+        count = 0
+        while True:
+            await semaphore.acquire()
+            batch = await asyncio.to_thread(next_batch)
+            if not batch:
+                semaphore.release()
+                break
+
+            count += len(batch)
+            tasks.append(asyncio.create_task(bounded(len(tasks) + 1, batch)))
+
+        await asyncio.gather(*tasks)
+        return count
+
+    return asyncio.run(run())
+
+
 @app.command()
 def dataset(
     base_url: str = typer.Option(
@@ -42,12 +249,12 @@ def dataset(
     db_name: str = typer.Option("rcabench", help="MySQL database name"),
     db_port: int = typer.Option(32206, help="MySQL port"),
     sleep_time: int = typer.Option(
-        30, help="Wait time after each submission (seconds)"
+        30, help="Minimum interval between submissions (seconds), 0 to disable"
     ),
+    batch_size: int = typer.Option(100, help="Records sent per submission"),
+    concurrency: int = typer.Option(10, help="Maximum in-flight submissions"),
 ):
-    configuration: Configuration = Configuration(host=base_url)
-
-    with ApiClient(configuration=configuration) as client:
+    with get_api_client(base_url, concurrency) as client:
         api = DatasetApi(api_client=client)
         try:
             with connect_mysql(
@@ -55,12 +262,52 @@ def dataset(
             ) as connection:
                 print("✅ Successfully connected to MySQL")
 
-                with connection.cursor(dictionary=True) as cursor:
-                    # Get version information
-                    cursor.execute("SELECT VERSION() as version")
-                    version_info: Optional[Dict[str, Any]] = cursor.fetchone()  # type: ignore
-                    assert version_info, "Failed to get MySQL version information"
-                    print(f"📋 MySQL version: {version_info['version']}")
+                # Shared fields are validated once; model_copy skips validation
+                payload_template = DtoDatasetBuildPayload(
+                    benchmark="clickhouse", name="", pre_duration=4
+                )
+
+                def post(payloads: List[Any]) -> Any:
+                    return api.api_v1_datasets_post(
+                        body=DtoSubmitDatasetBuildingReq(
+                            project_name="pair_diagnosis",
+                            payloads=payloads,
+                        ),
+                    )
+
+                def submit_batch(
+                    index: int, batch: List[Dict[str, Any]]
+                ) -> SubmitOutcome:
+                    payloads = []
+                    lines = []
+                    for row in batch:
+                        injection_id = row["id"]
+                        injection_name = str(row["injection_name"])
+                        namespace, _, _ = injection_name.partition("-")
+                        lines.append(
+                            f"  Batch {index}: ID={injection_id}, Name={injection_name}, Namespace={namespace}"
+                        )
+                        payloads.append(
+                            payload_template.model_copy(
+                                update={
+                                    "name": injection_name,
+                                    "env_vars": {
+                                        "NAMESPACE": namespace,
+                                    },
+                                }
+                            )
+                        )
+
+                    # One write per batch keeps concurrent batches from interleaving
+                    lines.append(f"Processing batch {index}: {len(payloads)} records")
+                    print("\n".join(lines))
+
+                    return submit_payloads(post, payloads, "Dataset")
+
+                # Buffered: the rows are only (id, name), and reading them
+                # up front keeps the slow submissions from stalling the server
+                with connection.cursor(dictionary=True, buffered=True) as cursor:
+                    print_mysql_version(connection)
 
                     # Execute main query
                     query = """
@@ -71,46 +318,15 @@ def dataset(
                     """
 
                     cursor.execute(query)
-                    rows = cursor.fetchall()
-
-                print(f"📋 Query result: found {len(rows)} records")
-
-                for index, row in enumerate(rows, 1):
-                    injection_id = row["id"]  # type: ignore
-                    injection_name = str(row["injection_name"])  # type: ignore
-
-                    print(
-                        f"Processing {index}/{len(rows)}: ID={injection_id}, Name={injection_name}"
+                    count = submit_batches(
+                        cursor,  # type: ignore
+                        submit_batch,
+                        batch_size,
+                        concurrency,
+                        sleep_time,
                     )
 
-                    try:
-                        namespace = injection_name.split("-")[0]
-                        print(f"  Extracted namespace: {namespace}")
-
-                        resp = api.api_v1_datasets_post(
-                            body=DtoSubmitDatasetBuildingReq(
-                                project_name="pair_diagnosis",
-                                payloads=[
-                                    DtoDatasetBuildPayload(
-                                        benchmark="clickhouse",
-                                        name=injection_name,
-                                        pre_duration=4,
-                                        env_vars={
-                                            "NAMESPACE": namespace,
-                                        },
-                                    ),
-                                ],
-                            ),
-                        )
-
-                        print(f"  🔄 Dataset submission successful: {resp}")
-
-                    except Exception as submit_error:
-                        print(f"  ❌ Dataset submission failed: {submit_error}")
-                        continue
-
-                    print(f"  ⏳ Waiting {sleep_time} seconds...")
-                    time.sleep(sleep_time)
+                print(f"📋 Query result: processed {count} records")
 
         except Error as e:
             print(f"❌ MySQL error: {e}")
@@ -132,14 +348,18 @@ def detector(
     db_name: str = typer.Option("rcabench", help="MySQL database name"),
     db_port: int = typer.Option(32206, help="MySQL port"),
     sleep_time: int = typer.Option(
-        10, help="Wait time after each submission (seconds)"
+        10, help="Minimum interval between submissions (seconds), 0 to disable"
     ),
+    batch_size: int = typer.Option(100, help="Records sent per submission"),
+    concurrency: int = typer.Option(10, help="Maximum in-flight submissions"),
     detector_image: str = typer.Option("detector", help="Detector image name"),
+    min_id: int = typer.Option(
+        0,
+        help="Only consider injections with an ID above this (e.g. the last run's highest)",
+    ),
     # detector_tag: str = typer.Option("latest", help="Detector image tag"),
 ):
-    configuration: Configuration = Configuration(host=base_url)
-
-    with ApiClient(configuration=configuration) as client:
+    with get_api_client(base_url, concurrency) as client:
         api = AlgorithmApi(api_client=client)
 
         try:
@@ -148,58 +368,71 @@ def detector(
             ) as connection:
                 print("✅ Successfully connected to MySQL")
 
-                with connection.cursor(dictionary=True) as cursor:
-                    # Get version information
-                    cursor.execute("SELECT VERSION() as version")
-                    version_info: Optional[Dict[str, Any]] = cursor.fetchone()  # type: ignore
-                    assert version_info, "Failed to get MySQL version information"
-                    print(f"📋 MySQL version: {version_info['version']}")
+                # Shared fields are validated once; model_copy skips validation
+                payload_template = DtoExecutionPayload(
+                    algorithm=DtoAlgorithmItem(name=detector_image), dataset=""
+                )
 
-                    query = """
-                    SELECT id, injection_name 
-                    FROM fault_injections
-                    WHERE id NOT IN (
-                        SELECT DISTINCT fis.id
-                        FROM fault_injections fis 
-                        JOIN execution_results er ON fis.id = er.datapack_id
-                        JOIN detectors d ON er.id = d.execution_id
-                    ) AND status = 4
-                    ORDER BY id DESC
-                    """
+                def post(payloads: List[Any]) -> Any:
+                    return api.api_v1_algorithms_post(
+                        body=DtoSubmitExecutionReq(
+                            project_name="pair_diagnosis",
+                            payloads=payloads,
+                        ),
+                    )
 
-                    cursor.execute(query)
-                    rows = cursor.fetchall()
+                def submit_batch(
+                    index: int, batch: List[Dict[str, Any]]
+                ) -> SubmitOutcome:
+                    payloads = []
+                    lines = []
+                    for row in batch:
+                        injection_id = row["id"]
+                        injection_name = str(row["injection_name"])
+                        lines.append(
+                            f"  Batch {index}: ID={injection_id}, Name={injection_name}"
+                        )
+                        payloads.append(
+                            payload_template.model_copy(
+                                update={"dataset": injection_name}
+                            )
+                        )
 
-                print(f"📋 Query result: found {len(rows)} records")
+                    # One write per batch keeps concurrent batches from interleaving
+                    lines.append(f"Processing batch {index}: {len(payloads)} records")
+                    print("\n".join(lines))
 
-                for index, row in enumerate(rows, 1):
-                    injection_id = row["id"]  # type: ignore
-                    injection_name = str(row["injection_name"])  # type: ignore
+                    return submit_payloads(post, payloads, "Detector")
 
-                    print(
-                        f"Processing {index}/{len(rows)}: ID={injection_id}, Name={injection_name}"
-                    )
+                # Buffered: the rows are only (id, name), and reading them
+                # up front keeps the slow submissions from stalling the server
+                with connection.cursor(dictionary=True, buffered=True) as cursor:
+                    print_mysql_version(connection)
 
-                    try:
-                        resp = api.api_v1_algorithms_post(
-                            body=DtoSubmitExecutionReq(
-                                project_name="pair_diagnosis",
-                                payloads=[
-                                    DtoExecutionPayload(
-                                        algorithm=DtoAlgorithmItem(name=detector_image),
-                                        dataset=injection_name,
-                                    )
-                                ],
-                            ),
-                        )
-                        print(f"  🔄 Detector submission successful: {resp}")
+                    # Anti-join on the (execution, detector) pair: an injection
+                    # is only excluded once one of its executions has detector
+                    # output, and each remaining injection yields a single row
+                    query = """
+                    SELECT fis.id, fis.injection_name
+                    FROM fault_injections fis
+                    LEFT JOIN (
+                        execution_results er
+                        JOIN detectors d ON er.id = d.execution_id
+                    ) ON er.datapack_id = fis.id
+                    WHERE fis.id > %s AND fis.status = 4 AND d.execution_id IS NULL
+                    ORDER BY fis.id DESC
+                    """
 
-                    except Exception as submit_error:
-                        print(f"  ❌ Detector submission failed: {submit_error}")
-                        continue
+                    cursor.execute(query, (min_id,))
+                    count = submit_batches(
+                        cursor,  # type: ignore
+                        submit_batch,
+                        batch_size,
+                        concurrency,
+                        sleep_time,
+                    )
 
-                    print(f"  ⏳ Waiting {sleep_time} seconds...")
-                    time.sleep(sleep_time)
+                print(f"📋 Query result: processed {count} records")
 
         except Error as e:
             print(f"❌ MySQL error: {e}")
@@ -218,9 +451,7 @@ def detector_single(
     ),
     detector_image: str = typer.Option("detector", help="Detector image name"),
 ):
-    configuration: Configuration = Configuration(host=base_url)
-
-    with ApiClient(configuration=configuration) as client:
+    with get_api_client(base_url) as client:
         api = AlgorithmApi(api_client=client)
         resp = api.api_v1_algorithms_post(
             body=DtoSubmitExecutionReq(
@@ -245,14 +476,15 @@ def align_db(
 ):
     path = "/mnt/jfs/rcabench_dataset"
 
-    # Get local directory list
-    local_datasets = []
+    # Get local directory set
+    local_datasets: set[str] = set()
     if os.path.exists(path):
-        local_datasets = [
-            entry
-            for entry in os.listdir(path)
-            if os.path.isdir(os.path.join(path, entry))
-        ]
+        # DirEntry.is_dir() uses the type returned by readdir, avoiding one
+        # stat() per entry on the network-backed dataset mount
+        with os.scandir(path) as entries:
+            local_datasets = {
+                entry.name for entry in entries if entry.is_dir(follow_symlinks=False)
+            }
         print(f"📁 Found {len(local_datasets)} local dataset directories")
     else:
         print(f"⚠️ Path does not exist: {path}")
@@ -260,86 +492,59 @@ def align_db(
 
     with connect_mysql(db_host, db_user, db_password, db_name, db_port) as connection:
         with connection.cursor(dictionary=True) as cursor:
-            cursor.execute("SELECT VERSION() as version")
-            version_info: Optional[Dict[str, Any]] = cursor.fetchone()
-            assert version_info, "Failed to get MySQL version information"
-            print(f"📋 MySQL version: {version_info['version']}")
+            print_mysql_version(connection)
 
+            # Only the name set and stale ids are needed, so skip the sort
             query = """
             SELECT id, name 
             FROM fault_injections
-            ORDER BY id DESC
             """
-            cursor.execute(query)
-            rows = cursor.fetchall()
 
-            print(f"📋 Database query result: found {len(rows)} records")
-
-            # Check if database records exist locally, delete if not found
+            # Check if database records exist locally, delete if not found.
+            # The scan is streamed so only names and stale ids stay in memory
+            database_datasets: set[str] = set()
+            stale_rows = []
+            row_count = 0
+            with connection.cursor(dictionary=True, buffered=False) as scan_cursor:
+                scan_cursor.execute(query)
+                for row in scan_cursor:
+                    row_count += 1
+                    injection_name = str(row["name"])
+                    database_datasets.add(injection_name)
+
+                    if injection_name not in local_datasets:
+                        stale_rows.append((row["id"], injection_name))
+
+            print(f"📋 Database query result: found {row_count} records")
+
+            # Delete all stale records with one statement per table and chunk,
+            # committed as a single transaction. Each table is cleared for every
+            # chunk before moving on, so the prepared cursor only re-prepares
+            # when the statement text changes rather than on every execute
             deleted_count = 0
-            database_datasets = []
-            for row in rows:
-                injection_id = row["id"]
-                injection_name = str(row["name"])
-                database_datasets.append(injection_name)
-
-                if injection_name not in local_datasets:
-                    try:
-                        # Delete dependent table data (in foreign key dependency order)
-                        # Based on new entity.go structure
-
-                        # 1. Delete detector_results table
-                        cursor.execute(
-                            """DELETE dr FROM detector_results dr 
-JOIN executions e ON dr.execution_id = e.id 
-WHERE e.datapack_id = %s
-                        """,
-                            (injection_id,),
-                        )
-
-                        # 2. Delete granularity_results table
-                        cursor.execute(
-                            """DELETE gr FROM granularity_results gr
-JOIN executions e ON gr.execution_id = e.id 
-WHERE e.datapack_id = %s
-                        """,
-                            (injection_id,),
-                        )
-
-                        # 3. Delete executions table
-                        cursor.execute(
-                            """
-DELETE FROM executions WHERE datapack_id = %s
-                        """,
-                            (injection_id,),
-                        )
-
-                        # 4. Delete dataset_version_injections table
-                        cursor.execute(
-                            """
-DELETE FROM dataset_version_injections WHERE injection_id = %s
-                        """,
-                            (injection_id,),
-                        )
-
-                        # 5. Finally delete main table fault_injections
-                        cursor.execute(
-                            """
-DELETE FROM fault_injections WHERE id = %s
-                        """,
-                            (injection_id,),
-                        )
+            if stale_rows:
+                stale_ids = [injection_id for injection_id, _ in stale_rows]
+                try:
+                    with connection.cursor(prepared=True) as delete_cursor:
+                        for query in DELETE_STALE_INJECTION_QUERIES:
+                            for start in range(0, len(stale_ids), IN_CLAUSE_CHUNK_SIZE):
+                                chunk = stale_ids[start : start + IN_CLAUSE_CHUNK_SIZE]
+                                placeholders = ", ".join(["%s"] * len(chunk))
+                                delete_cursor.execute(
+                                    query.format(ids=placeholders), chunk
+                                )
 
-                        # Commit transaction
-                        connection.commit()
-                        print(
+                    connection.commit()
+                    print(
+                        "\n".join(
                             f"🗑️ Deleted database record: ID={injection_id}, Name={injection_name}"
+                            for injection_id, injection_name in stale_rows
                         )
-                        deleted_count += 1
-                    except Exception as e:
-                        # Rollback transaction
-                        connection.rollback()
-                        print(f"❌ Failed to delete record ID={injection_id}: {e}")
+                    )
+                    deleted_count = len(stale_rows)
+                except Exception as e:
+                    connection.rollback()
+                    print(f"❌ Failed to delete {len(stale_rows)} stale records: {e}")
 
             print(f"✅ Total deleted {deleted_count} database records")
 
@@ -359,9 +564,8 @@ DELETE FROM fault_injections WHERE id = %s
                     return None
                 try:
                     if isinstance(timestamp_str, str):
-                        return datetime.fromisoformat(
-                            timestamp_str.replace("Z", "+00:00")
-                        )
+                        # Python 3.11+ accepts the trailing "Z" directly
+                        return datetime.fromisoformat(timestamp_str)
                     return timestamp_str
                 except Exception:
                     return None
@@ -408,86 +612,82 @@ DELETE FROM fault_injections WHERE id = %s
                     "⚠️ Warning: No pedestal found in database, cannot add new records"
                 )
 
-            for local_dataset in local_datasets:
-                if local_dataset not in database_datasets:
-                    injection_json_path = os.path.join(
-                        path, local_dataset, "injection.json"
+            # Collect rows for every addable local dataset, then insert them in
+            # groups with one executemany per table (sent as multi-row INSERTs)
+            task_values: Dict[str, tuple] = {}
+            # (local dataset, task id, fault_injections row)
+            pending_records: List[Tuple[str, str, tuple]] = []
+
+            missing_datasets = sorted(local_datasets - database_datasets)
+
+            def injection_json_path_of(local_dataset: str) -> str:
+                return os.path.join(path, local_dataset, "injection.json")
+
+            with ThreadPoolExecutor(max_workers=INJECTION_LOAD_WORKERS) as executor:
+                loads = [
+                    executor.submit(
+                        load_injection_json, injection_json_path_of(local_dataset)
                     )
-                    if os.path.exists(injection_json_path):
-                        try:
-                            with open(injection_json_path, "r", encoding="utf-8") as f:
-                                injection_data = json.load(f)
-
-                            # Get benchmark_id from benchmark name
-                            benchmark_name = safe_get(injection_data, "benchmark")
-                            benchmark_id = (
-                                get_benchmark_id(benchmark_name)
-                                if benchmark_name
-                                else None
-                            )
+                    for local_dataset in missing_datasets
+                ]
 
-                            if benchmark_id is None:
-                                print(
-                                    f"⚠️ Skipping {local_dataset}: benchmark '{benchmark_name}' not found in database"
-                                )
-                                skipped_count += 1
-                                continue
+            for local_dataset, load in zip(missing_datasets, loads):
+                try:
+                    injection_data = load.result()
+                    if injection_data is None:
+                        print(
+                            f"⚠️ Missing injection.json file: {injection_json_path_of(local_dataset)}"
+                        )
+                        continue
 
-                            if default_pedestal_id is None:
-                                print(
-                                    f"⚠️ Skipping {local_dataset}: no pedestal available"
-                                )
-                                skipped_count += 1
-                                continue
+                    # Get benchmark_id from benchmark name
+                    benchmark_name = safe_get(injection_data, "benchmark")
+                    benchmark_id = (
+                        get_benchmark_id(benchmark_name) if benchmark_name else None
+                    )
 
-                            task_id = safe_get(injection_data, "task_id")
-                            if task_id is None:
-                                print(
-                                    f"⚠️ Skipping {local_dataset}: no task_id in injection.json"
-                                )
-                                skipped_count += 1
-                                continue
+                    if benchmark_id is None:
+                        print(
+                            f"⚠️ Skipping {local_dataset}: benchmark '{benchmark_name}' not found in database"
+                        )
+                        skipped_count += 1
+                        continue
 
-                            # First, ensure task exists in tasks table
-                            cursor.execute(
-                                "SELECT id FROM tasks WHERE id = %s", (task_id,)
-                            )
-                            if cursor.fetchone() is None:
-                                # Create a placeholder task
-                                cursor.execute(
-                                    """
-                                    INSERT INTO tasks (id, type, immediate, execute_time, state, status, created_at, updated_at)
-                                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                                    """,
-                                    (
-                                        task_id,
-                                        1,  # type: injection task
-                                        True,
-                                        0,
-                                        3,  # state: completed
-                                        1,  # status: enabled
-                                        parse_timestamp(
-                                            safe_get(injection_data, "created_at")
-                                        )
-                                        or datetime.now(),
-                                        parse_timestamp(
-                                            safe_get(injection_data, "updated_at")
-                                        )
-                                        or datetime.now(),
-                                    ),
-                                )
+                    if default_pedestal_id is None:
+                        print(f"⚠️ Skipping {local_dataset}: no pedestal available")
+                        skipped_count += 1
+                        continue
 
-                            # Build insert statement
-                            insert_query = """
-                            INSERT INTO fault_injections (
-                                name, fault_type, display_config, engine_config, 
-                                pre_duration, start_time, end_time, state, status,
-                                description, benchmark_id, pedestal_id, task_id,
-                                created_at, updated_at
-                            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                            """
-
-                            values = (
+                    task_id = safe_get(injection_data, "task_id")
+                    if task_id is None:
+                        print(
+                            f"⚠️ Skipping {local_dataset}: no task_id in injection.json"
+                        )
+                        skipped_count += 1
+                        continue
+
+                    created_at = parse_timestamp(safe_get(injection_data, "created_at"))
+                    updated_at = parse_timestamp(safe_get(injection_data, "updated_at"))
+
+                    task_values.setdefault(
+                        task_id,
+                        (
+                            task_id,
+                            1,  # type: injection task
+                            True,
+                            0,
+                            3,  # state: completed
+                            1,  # status: enabled
+                            created_at or datetime.now(),
+                            updated_at or datetime.now(),
+                        ),
+                    )
+
+                    pending_records.append(
+                        (
+                            local_dataset,
+                            task_id,
+                            (
                                 safe_get(injection_data, "name")
                                 or safe_get(injection_data, "injection_name"),
                                 safe_get(injection_data, "fault_type"),
@@ -504,22 +704,57 @@ DELETE FROM fault_injections WHERE id = %s
                                 benchmark_id,
                                 default_pedestal_id,
                                 task_id,
-                                parse_timestamp(safe_get(injection_data, "created_at")),
-                                parse_timestamp(safe_get(injection_data, "updated_at")),
-                            )
+                                created_at,
+                                updated_at,
+                            ),
+                        )
+                    )
+
+                except Exception as e:
+                    print(f"❌ Failed to read record {local_dataset}: {e}")
+
+            # Tasks already written by an earlier group
+            inserted_task_ids = set()
 
-                            cursor.execute(insert_query, values)
-                            connection.commit()
-                            print(f"➕ Added database record: Name={local_dataset}")
-                            added_count += 1
+            def insert_group(group: List[Tuple[str, str, tuple]]) -> int:
+                """Insert a group of records in one transaction, bisecting on failure"""
+                group_tasks = {
+                    task_id: task_values[task_id]
+                    for _, task_id, _ in group
+                    if task_id not in inserted_task_ids
+                }
+                try:
+                    if group_tasks:
+                        cursor.executemany(
+                            INSERT_TASK_QUERY, list(group_tasks.values())
+                        )
+                    cursor.executemany(
+                        INSERT_INJECTION_QUERY, [values for _, _, values in group]
+                    )
+                    connection.commit()
+                except Exception as e:
+                    connection.rollback()
+                    if len(group) == 1:
+                        print(f"❌ Failed to add record {group[0][0]}: {e}")
+                        return 0
 
-                        except Exception as e:
-                            print(f"❌ Failed to add record {local_dataset}: {e}")
-                            connection.rollback()
-                    else:
-                        print(f"⚠️ Missing injection.json file: {injection_json_path}")
+                    middle = len(group) // 2
+                    return insert_group(group[:middle]) + insert_group(group[middle:])
+
+                inserted_task_ids.update(group_tasks)
+                print(
+                    "\n".join(
+                        f"➕ Added database record: Name={local_dataset}"
+                        for local_dataset, _, _ in group
+                    )
+                )
+                return len(group)
+
+            for start in range(0, len(pending_records), INSERT_GROUP_SIZE):
+                added_count += insert_group(
+                    pending_records[start : start + INSERT_GROUP_SIZE]
+                )
 
-            connection.commit()
             print(
                 f"✅ Total added {added_count} database records, skipped {skipped_count}"
             )
@@ -1,22 +1,59 @@
+from __future__ import annotations
+
+import base64
+import json
+import threading
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import ClassVar
+from typing import TYPE_CHECKING, ClassVar
+from weakref import WeakValueDictionary
 
 from pydantic import StrictStr
 
-from rcabench.openapi.api_client import ApiClient
-from rcabench.openapi.configuration import Configuration
+if TYPE_CHECKING:
+    # The generated package imports every model on load, so it is only pulled
+    # in once a client is actually built
+    from rcabench.openapi.api_client import ApiClient
+
+# Re-authenticate this many seconds before the token actually expires
+TOKEN_EXPIRY_SKEW_SECONDS = 30
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SessionData:
     access_token: StrictStr | None = None
+    expires_at: float | None = None
     api_client: ApiClient | None = None
 
+    def is_valid(self) -> bool:
+        if self.access_token is None:
+            return False
+        if self.expires_at is None:
+            return True
+        return time.time() < self.expires_at - TOKEN_EXPIRY_SKEW_SECONDS
+
 
 CacheKey = tuple[str, str, str | None]
 
 
+def require_setting(value: str | None, message: str) -> str:
+    """Return a resolved credential setting, raising ValueError when it is missing."""
+    if not value:
+        raise ValueError(message)
+    return value
+
+
+def get_token_expiry(token: str) -> float | None:
+    """Return the unverified `exp` claim of a JWT, or None if the token carries none."""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
 class BaseRCABenchClient(ABC):
     """
     Shared authenticated client lifecycle for hand-written RCABench clients.
@@ -27,52 +64,111 @@ class BaseRCABenchClient(ABC):
     - _authenticate implementation
     """
 
-    _instances: ClassVar[dict[CacheKey, "BaseRCABenchClient"]] = {}
+    _instances: ClassVar[WeakValueDictionary[CacheKey, BaseRCABenchClient]] = WeakValueDictionary()
     _sessions: ClassVar[dict[CacheKey, SessionData]] = {}
+    # One lock per session key, so concurrent threads never race two token
+    # exchanges for the same session while other sessions refresh independently
+    _auth_locks: ClassVar[dict[CacheKey, threading.Lock]] = {}
+    # Guards the instance and auth-lock registries; never held over network calls
+    _lock = threading.RLock()
     base_url: str
     instance_key: CacheKey
     _initialized: bool
 
     def __enter__(self) -> ApiClient:
-        if self.instance_key not in self.__class__._sessions or not self._is_session_valid():
-            self._authenticate()
         return self._get_authenticated_client()
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         pass
 
-    def _is_session_valid(self) -> bool:
+    def _create_api_client(self) -> ApiClient:
+        from rcabench.openapi.api_client import ApiClient
+        from rcabench.openapi.configuration import Configuration
+
+        config = Configuration(
+            host=self.base_url,
+            api_key={},
+            api_key_prefix={"BearerAuth": "Bearer"},
+        )
+        return ApiClient(config)
+
+    def _get_session_api_client(self) -> ApiClient:
+        """
+        Return the ApiClient of the current session, creating it on first use.
+        Token exchanges go through the same client so they share its connection pool.
+        """
         session_data = self.__class__._sessions.get(self.instance_key)
-        if not session_data:
-            return False
-        return session_data.access_token is not None
+        if session_data is None:
+            session_data = SessionData()
+            self.__class__._sessions[self.instance_key] = session_data
+        if session_data.api_client is None:
+            session_data.api_client = self._create_api_client()
+        return session_data.api_client
+
+    def _store_session(self, access_token: str) -> None:
+        """
+        Record a freshly issued token on the session, updating its ApiClient
+        in place if one was already handed out.
+        """
+        session_data = self.__class__._sessions.get(self.instance_key)
+        if session_data is None:
+            session_data = SessionData()
+            self.__class__._sessions[self.instance_key] = session_data
+
+        session_data.access_token = access_token
+        session_data.expires_at = get_token_expiry(access_token)
+        if session_data.api_client is not None:
+            session_data.api_client.configuration.api_key["BearerAuth"] = access_token
+
+    def _invalidate_session(self) -> None:
+        """Force re-authentication on next use while keeping the session's ApiClient."""
+        session_data = self.__class__._sessions.get(self.instance_key)
+        if session_data is not None:
+            session_data.access_token = None
+            session_data.expires_at = None
+
+    def _get_auth_lock(self) -> threading.Lock:
+        with self._lock:
+            return self.__class__._auth_locks.setdefault(self.instance_key, threading.Lock())
 
     @abstractmethod
     def _authenticate(self) -> None:
         raise NotImplementedError
 
     def _get_authenticated_client(self) -> ApiClient:
-        if self.instance_key not in self.__class__._sessions or not self._is_session_valid():
-            self._authenticate()
+        # Fast path: a valid session whose client has already been built needs no lock
+        session_data = self.__class__._sessions.get(self.instance_key)
+        if session_data is not None and session_data.api_client is not None and session_data.is_valid():
+            return session_data.api_client
 
-        session_data = self.__class__._sessions[self.instance_key]
-        bearer_token = session_data.access_token
-        assert bearer_token is not None, "Access token is missing in session data"
+        with self._get_auth_lock():
+            session_data = self.__class__._sessions.get(self.instance_key)
+            if session_data is None or not session_data.is_valid():
+                self._authenticate()
+                session_data = self.__class__._sessions[self.instance_key]
 
-        if not session_data.api_client:
-            auth_config = Configuration(
-                host=self.base_url,
-                api_key={"BearerAuth": bearer_token},
-                api_key_prefix={"BearerAuth": "Bearer"},
-            )
-            session_data.api_client = ApiClient(auth_config)
+            bearer_token = session_data.access_token
+            assert bearer_token is not None, "Access token is missing in session data"
 
-        return session_data.api_client
+            if not session_data.api_client:
+                session_data.api_client = self._create_api_client()
+                session_data.api_client.configuration.api_key["BearerAuth"] = bearer_token
+
+            return session_data.api_client
 
     def get_client(self) -> ApiClient:
         return self._get_authenticated_client()
 
     @classmethod
     def clear_sessions(cls) -> None:
-        cls._sessions.clear()
-        cls._instances.clear()
+        with cls._lock:
+            # Wait for in-flight authentications so none writes into the cleared registry
+            auth_locks = list(cls._auth_locks.values())
+            for auth_lock in auth_locks:
+                auth_lock.acquire()
+            try:
+                cls._sessions.clear()
+                cls._instances.clear()
+            finally:
+                for auth_lock in auth_locks:
+                    auth_lock.release()
@@ -1,14 +1,13 @@
 import os
 import secrets
+import threading
 import time
 from hashlib import sha256
 from hmac import new as hmac_new
 from typing import ClassVar
+from weakref import WeakValueDictionary
 
-from rcabench.client.base import BaseRCABenchClient, CacheKey, SessionData
-from rcabench.openapi.api.authentication_api import AuthenticationApi
-from rcabench.openapi.api_client import ApiClient
-from rcabench.openapi.configuration import Configuration
+from rcabench.client.base import BaseRCABenchClient, CacheKey, SessionData, require_setting
 
 
 class RCABenchClient(BaseRCABenchClient):
@@ -21,29 +20,39 @@ class RCABenchClient(BaseRCABenchClient):
     - RCABENCH_KEY_SECRET
     """
 
-    _instances: ClassVar[dict[CacheKey, BaseRCABenchClient]] = {}
+    _instances: ClassVar[WeakValueDictionary[CacheKey, "RCABenchClient"]] = WeakValueDictionary()
     _sessions: ClassVar[dict[CacheKey, SessionData]] = {}
+    _auth_locks: ClassVar[dict[CacheKey, threading.Lock]] = {}
     _token_exchange_path = "/api/v2/auth/api-key/token"
 
+    @staticmethod
+    def _resolve_credentials(base_url: str | None) -> tuple[str, str, str]:
+        return (
+            require_setting(base_url or os.getenv("RCABENCH_BASE_URL"), "base_url or RCABENCH_BASE_URL is not set"),
+            require_setting(os.getenv("RCABENCH_KEY_ID"), "RCABENCH_KEY_ID is not set"),
+            require_setting(os.getenv("RCABENCH_KEY_SECRET"), "RCABENCH_KEY_SECRET is not set"),
+        )
+
     def __new__(
         cls,
         base_url: str | None = None,
     ):
-        actual_base_url = base_url or os.getenv("RCABENCH_BASE_URL")
-        actual_key_id = os.getenv("RCABENCH_KEY_ID")
-        actual_key_secret = os.getenv("RCABENCH_KEY_SECRET")
+        actual_base_url, actual_key_id, actual_key_secret = cls._resolve_credentials(base_url)
 
-        assert actual_base_url is not None, "base_url or RCABENCH_BASE_URL is not set"
-        assert actual_key_id is not None, "RCABENCH_KEY_ID is not set"
-        assert actual_key_secret is not None, "RCABENCH_KEY_SECRET is not set"
-        instance_key = (actual_base_url, actual_key_id, actual_key_secret)
+        # The secret is not part of the key, so rotating it reuses the instance
+        instance_key = (actual_base_url, actual_key_id, None)
 
-        if instance_key not in cls._instances:
-            instance = super().__new__(cls)
-            cls._instances[instance_key] = instance
-            instance._initialized = False
+        with cls._lock:
+            instance = cls._instances.get(instance_key)
+            if instance is None:
+                instance = super().__new__(cls)
+                cls._instances[instance_key] = instance
+                instance._initialized = False
+            elif instance._initialized and instance.key_secret != actual_key_secret:
+                instance.key_secret = actual_key_secret
+                instance._invalidate_session()
 
-        return cls._instances[instance_key]
+            return instance
 
     def __init__(
         self,
@@ -52,17 +61,8 @@ class RCABenchClient(BaseRCABenchClient):
         if hasattr(self, "_initialized") and self._initialized:
             return
 
-        actual_base_url = base_url or os.getenv("RCABENCH_BASE_URL")
-        actual_key_id = os.getenv("RCABENCH_KEY_ID")
-        actual_key_secret = os.getenv("RCABENCH_KEY_SECRET")
-
-        assert actual_base_url is not None, "base_url or RCABENCH_BASE_URL is not set"
-        assert actual_key_id is not None, "RCABENCH_KEY_ID is not set"
-        assert actual_key_secret is not None, "RCABENCH_KEY_SECRET is not set"
-        self.base_url = actual_base_url
-        self.key_id = actual_key_id
-        self.key_secret = actual_key_secret
-        self.instance_key = (self.base_url, self.key_id, self.key_secret)
+        self.base_url, self.key_id, self.key_secret = self._resolve_credentials(base_url)
+        self.instance_key = (self.base_url, self.key_id, None)
 
         self._initialized = True
 
@@ -70,32 +70,28 @@ class RCABenchClient(BaseRCABenchClient):
         self._exchange_api_key_token()
 
     def _exchange_api_key_token(self) -> None:
-        config = Configuration(host=self.base_url)
-        with ApiClient(config) as api_client:
-            auth_api = AuthenticationApi(api_client)
-            assert self.base_url is not None
-            assert self.key_id is not None
-            assert self.key_secret is not None
-            timestamp = str(int(time.time()))
-            nonce = secrets.token_hex(16)
-            signature = self._sign_api_key_request(
-                key_secret=self.key_secret,
-                method="POST",
-                path=self._token_exchange_path,
-                timestamp=timestamp,
-                nonce=nonce,
-            )
-            response = auth_api.exchange_api_key_token(
-                x_key_id=self.key_id,
-                x_timestamp=timestamp,
-                x_nonce=nonce,
-                x_signature=signature,
-            )
-            assert response.data is not None
-            self.__class__._sessions[self.instance_key] = SessionData(
-                access_token=response.data.token,
-                api_client=None,
-            )
+        from rcabench.openapi.api.authentication_api import AuthenticationApi
+
+        # The token endpoint takes no bearer auth, so the session's client can be reused
+        auth_api = AuthenticationApi(self._get_session_api_client())
+        timestamp = str(int(time.time()))
+        nonce = secrets.token_hex(16)
+        signature = self._sign_api_key_request(
+            key_secret=self.key_secret,
+            method="POST",
+            path=self._token_exchange_path,
+            timestamp=timestamp,
+            nonce=nonce,
+        )
+        response = auth_api.exchange_api_key_token(
+            x_key_id=self.key_id,
+            x_timestamp=timestamp,
+            x_nonce=nonce,
+            x_signature=signature,
+        )
+        assert response.data is not None
+        assert response.data.token is not None
+        self._store_session(response.data.token)
 
     @staticmethod
     def _sign_api_key_request(
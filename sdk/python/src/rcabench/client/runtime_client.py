@@ -1,7 +1,9 @@
 import os
+import threading
 from typing import ClassVar
+from weakref import WeakValueDictionary
 
-from rcabench.client.base import BaseRCABenchClient, CacheKey, SessionData
+from rcabench.client.base import BaseRCABenchClient, CacheKey, SessionData, require_setting
 
 
 class RCABenchRuntimeClient(BaseRCABenchClient):
@@ -13,27 +15,33 @@ class RCABenchRuntimeClient(BaseRCABenchClient):
     - RCABENCH_SERVICE_TOKEN
     """
 
-    _instances: ClassVar[dict[CacheKey, BaseRCABenchClient]] = {}
+    _instances: ClassVar[WeakValueDictionary[CacheKey, BaseRCABenchClient]] = WeakValueDictionary()
     _sessions: ClassVar[dict[CacheKey, SessionData]] = {}
+    _auth_locks: ClassVar[dict[CacheKey, threading.Lock]] = {}
+
+    @staticmethod
+    def _resolve_credentials(base_url: str | None) -> tuple[str, str]:
+        return (
+            require_setting(base_url or os.getenv("RCABENCH_BASE_URL"), "base_url or RCABENCH_BASE_URL is not set"),
+            require_setting(os.getenv("RCABENCH_SERVICE_TOKEN"), "RCABENCH_SERVICE_TOKEN is not set"),
+        )
 
     def __new__(
         cls,
         base_url: str | None = None,
     ):
-        actual_base_url = base_url or os.getenv("RCABENCH_BASE_URL")
-        actual_service_token = os.getenv("RCABENCH_SERVICE_TOKEN")
-
-        assert actual_base_url is not None, "base_url or RCABENCH_BASE_URL is not set"
-        assert actual_service_token is not None, "RCABENCH_SERVICE_TOKEN is not set"
+        actual_base_url, actual_service_token = cls._resolve_credentials(base_url)
 
         instance_key = (actual_base_url, actual_service_token, None)
 
-        if instance_key not in cls._instances:
-            instance = super().__new__(cls)
-            cls._instances[instance_key] = instance
-            instance._initialized = False
+        with cls._lock:
+            instance = cls._instances.get(instance_key)
+            if instance is None:
+                instance = super().__new__(cls)
+                cls._instances[instance_key] = instance
+                instance._initialized = False
 
-        return cls._instances[instance_key]
+            return instance
 
     def __init__(
         self,
@@ -42,19 +50,9 @@ class RCABenchRuntimeClient(BaseRCABenchClient):
         if hasattr(self, "_initialized") and self._initialized:
             return
 
-        actual_base_url = base_url or os.getenv("RCABENCH_BASE_URL")
-        actual_service_token = os.getenv("RCABENCH_SERVICE_TOKEN")
-
-        assert actual_base_url is not None, "base_url or RCABENCH_BASE_URL is not set"
-        assert actual_service_token is not None, "RCABENCH_SERVICE_TOKEN is not set"
-
-        self.base_url = actual_base_url
-        self.service_token = actual_service_token
+        self.base_url, self.service_token = self._resolve_credentials(base_url)
         self.instance_key = (self.base_url, self.service_token, None)
         self._initialized = True
 
     def _authenticate(self) -> None:
-        self.__class__._sessions[self.instance_key] = SessionData(
-            access_token=self.service_token,
-            api_client=None,
-        )
+        self._store_session(self.service_token)